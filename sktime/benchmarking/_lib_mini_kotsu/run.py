@@ -7,6 +7,8 @@ from typing import List, Optional, Union
 
 import pandas as pd
 
+from sktime.benchmarking._lib_mini_kotsu.store import write
+
 logger = logging.getLogger(__name__)
 
 
@@ -110,7 +112,7 @@ def run(
     )
     results_df = results_df.sort_values(by=["validation_id", "model_id"])
     results_df = results_df.reset_index(drop=True)
-    _write(
+    write(
         results_df,
         results_path,
         to_front_cols=["validation_id", "model_id", "runtime_secs"],
@@ -195,9 +197,3 @@ def _run_validation_model(validation, model, run_params: dict):
     results = validation(model, **run_params)
     elapsed_secs = time.time() - start_time
     return results, elapsed_secs
-
-
-def _write(df: pd.DataFrame, results_path: str, to_front_cols: List[str]):
-    """Write the results to the results path."""
-    df = df[to_front_cols + [col for col in df.columns if col not in to_front_cols]]
-    df.to_csv(results_path, index=False)
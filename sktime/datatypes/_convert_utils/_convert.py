@@ -59,22 +59,22 @@ def _extend_conversions(mtype, anchor_mtype, convert_dict, mtype_universe=None):
     reference to convert_dict
     CAVEAT: convert_dict passed to this function gets mutated, this is a reference
     """
-    keys = convert_dict.keys()
-    scitype = list(keys)[0][2]
+    # all keys share the same scitype, read it off the first key
+    scitype = next(iter(convert_dict))[2]
 
     if mtype_universe is None:
-        mtype_universe = {x[1] for x in list(keys)}
-        mtype_universe = mtype_universe.union([x[0] for x in list(keys)])
+        mtype_universe = {x[1] for x in convert_dict}
+        mtype_universe = mtype_universe.union(x[0] for x in convert_dict)
 
     for tp in set(mtype_universe).difference([mtype, anchor_mtype]):
-        if (anchor_mtype, tp, scitype) in convert_dict.keys():
-            if (mtype, tp, scitype) not in convert_dict.keys():
+        if (anchor_mtype, tp, scitype) in convert_dict:
+            if (mtype, tp, scitype) not in convert_dict:
                 convert_dict[(mtype, tp, scitype)] = _concat(
                     convert_dict[(mtype, anchor_mtype, scitype)],
                     convert_dict[(anchor_mtype, tp, scitype)],
                 )
-        if (tp, anchor_mtype, scitype) in convert_dict.keys():
-            if (tp, mtype, scitype) not in convert_dict.keys():
+        if (tp, anchor_mtype, scitype) in convert_dict:
+            if (tp, mtype, scitype) not in convert_dict:
                 convert_dict[(tp, mtype, scitype)] = _concat(
                     convert_dict[(tp, anchor_mtype, scitype)],
                     convert_dict[(anchor_mtype, mtype, scitype)],
@@ -32,10 +32,10 @@ class TestAllPairwiseTransformers(TransformerPairwiseFixtureGenerator, QuickTest
         trafo_name = type(estimator_instance).__name__
         dist_mat = scenario.run(estimator_instance, method_sequence=["transform"])
 
-        X = scenario.args["transform"]["X"]
-        len_X = len(scenario.args["transform"]["X"])
-        X2 = scenario.args["transform"].get("X2", X)
-        len_X2 = len(X2)
+        args = scenario.args["transform"]
+        X = args["X"]
+        X2 = args.get("X2", X)
+        len_X, len_X2 = len(X), len(X2)
 
         assert isinstance(
             dist_mat, np.ndarray
@@ -73,10 +73,10 @@ class TestAllPanelTransformers(TransformerPairwisePanelFixtureGenerator, QuickTe
         trafo_name = type(estimator_instance).__name__
         dist_mat = scenario.run(estimator_instance, method_sequence=["transform"])
 
-        X = scenario.args["transform"]["X"]
-        len_X = len(scenario.args["transform"]["X"])
-        X2 = scenario.args["transform"].get("X2", X)
-        len_X2 = len(X2)
+        args = scenario.args["transform"]
+        X = args["X"]
+        X2 = args.get("X2", X)
+        len_X, len_X2 = len(X), len(X2)
 
         assert isinstance(
             dist_mat, np.ndarray
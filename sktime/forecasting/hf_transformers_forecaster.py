@@ -17,10 +17,6 @@ else:
         pass
 
 
-if _check_soft_dependencies("transformers", severity="none"):
-    import transformers
-    from transformers import AutoConfig, Trainer, TrainingArguments
-
 from sktime.forecasting.base import BaseForecaster, ForecastingHorizon
 
 __author__ = ["benheid"]
@@ -50,6 +46,8 @@ class HFTransformersForecaster(BaseForecaster):
         Training arguments to use for the model. See `transformers.TrainingArguments`
         for details.
         Note that the `output_dir` argument is required.
+        Mixed precision training on supported hardware can be enabled by passing
+        `bf16=True` or `fp16=True`.
     compute_metrics : list, default=None
         List of metrics to compute during training. See `transformers.Trainer`
         for details.
@@ -120,12 +118,20 @@ class HFTransformersForecaster(BaseForecaster):
         self._training_args = training_args if training_args is not None else {}
         self.compute_metrics = compute_metrics
         self._compute_metrics = compute_metrics
-        self._compute_metrics = compute_metrics
         self.deterministic = deterministic
         self.callbacks = callbacks
         self._callbacks = callbacks
 
     def _fit(self, y, X, fh):
+        # Check fit strategy before any model is loaded
+        if self.fit_strategy not in ["minimal", "full"]:
+            raise ValueError("Unknown fit strategy")
+
+        # transformers is imported here rather than at module level,
+        # as its import is slow and only needed once the forecaster is used
+        import transformers
+        from transformers import AutoConfig, Trainer, TrainingArguments
+
         # Load model and extract config
         config = AutoConfig.from_pretrained(self.model_path)
 
@@ -148,7 +154,6 @@ class HFTransformersForecaster(BaseForecaster):
             )
 
         config = config.from_dict(_config)
-        import transformers
 
         prediction_model_class = None
         if hasattr(config, "architectures") and config.architectures is not None:
@@ -173,13 +178,12 @@ class HFTransformersForecaster(BaseForecaster):
             ignore_mismatched_sizes=True,
         )
 
-        # Freeze all loaded parameters
-        for param in self.model.parameters():
+        # Freeze all loaded parameters, and clamp the backbone parameters
+        # to avoid NaNs due to large values, in a single pass
+        for name, param in self.model.named_parameters():
             param.requires_grad = False
-
-        # Clamp all loaded parameters to avoid NaNs due to large values
-        for param in self.model.model.parameters():
-            param.clamp_(-1000, 1000)
+            if name.startswith("model."):
+                param.clamp_(-1000, 1000)
 
         # Reininit the weights of all layers that have mismatched sizes
         for key, _, _ in info["mismatched_keys"]:
@@ -191,7 +195,15 @@ class HFTransformersForecaster(BaseForecaster):
                 requires_grad=True,
             )
 
-        if self.validation_split is not None:
+        if self.fit_strategy == "minimal":
+            if len(info["mismatched_keys"]) == 0:
+                return  # No need to fit, skip building datasets and trainer
+        else:
+            for param in self.model.parameters():
+                param.requires_grad = True
+
+        # a split of None or 0.0 means no validation, no eval dataset is built
+        if self.validation_split:
             split = int(len(y) * (1 - self.validation_split))
 
             train_dataset = PyTorchDataset(
@@ -217,19 +229,10 @@ class HFTransformersForecaster(BaseForecaster):
 
             eval_dataset = None
 
-        training_args = deepcopy(self.training_args)
+        training_args = deepcopy(self._training_args)
         training_args["label_names"] = ["future_values"]
         training_args = TrainingArguments(**training_args)
 
-        if self.fit_strategy == "minimal":
-            if len(info["mismatched_keys"]) == 0:
-                return  # No need to fit
-        elif self.fit_strategy == "full":
-            for param in self.model.parameters():
-                param.requires_grad = True
-        else:
-            raise ValueError("Unknown fit strategy")
-
         trainer = Trainer(
             model=self.model,
             args=training_args,
@@ -242,54 +245,55 @@ class HFTransformersForecaster(BaseForecaster):
 
     def _predict(self, fh, X=None):
         if self.deterministic:
-            transformers.set_seed(42)
+            from transformers import set_seed
+
+            set_seed(42)
 
         if fh is None:
             fh = self.fh
         fh = fh.to_relative(self.cutoff)
 
         self.model.eval()
-        from torch import from_numpy
 
-        hist = self._y.values.reshape((1, -1))
+        # resolve config values, dtype and device once,
+        # to avoid repeated attribute and property calls below
+        config = self.model.config
+        prediction_length = config.prediction_length
+        dtype, device = self.model.dtype, self.model.device
+
+        # the model only looks back context_length plus the largest lag,
+        # so truncate the history before conversion and device transfer
+        past_length = config.context_length + max(config.lags_sequence)
+
+        # convert to float32 on the pandas side, avoiding object dtype arrays
+        hist = self._y.iloc[-past_length:].to_numpy(dtype=np.float32)
+        hist = hist.reshape((1, -1))
         if X is not None:
-            hist_x = self._X.values.reshape((1, -1, self._X.shape[-1]))
-            x_ = X.values.reshape((1, -1, self._X.shape[-1]))
-            if x_.shape[1] < self.model.config.prediction_length:
+            n_x = self._X.shape[-1]
+            hist_x = self._X.iloc[-past_length:].to_numpy(dtype=np.float32)
+            hist_x = hist_x.reshape((1, -1, n_x))
+            x_ = X.to_numpy(dtype=np.float32).reshape((1, -1, n_x))
+            if x_.shape[1] < prediction_length:
                 # TODO raise exception here?
-                x_ = np.resize(
-                    x_, (1, self.model.config.prediction_length, x_.shape[-1])
-                )
+                x_ = np.resize(x_, (1, prediction_length, x_.shape[-1]))
         else:
-            hist_x = np.array(
-                [
-                    [[]]
-                    * (
-                        self.model.config.context_length
-                        + max(self.model.config.lags_sequence)
-                    )
-                ]
+            hist_x = np.array([[[]] * past_length])
+            x_ = np.array([[[]] * prediction_length])
+
+        # no autograd bookkeeping is needed for forecasting
+        with torch.inference_mode():
+            pred = self.model.generate(
+                past_values=torch.from_numpy(hist).to(device=device, dtype=dtype),
+                past_time_features=torch.from_numpy(hist_x).to(
+                    device=device, dtype=dtype
+                ),
+                future_time_features=torch.from_numpy(x_).to(
+                    device=device, dtype=dtype
+                ),
+                past_observed_mask=torch.from_numpy((~np.isnan(hist)).astype(int)).to(
+                    device
+                ),
             )
-            x_ = np.array([[[]] * self.model.config.prediction_length])
-
-        pred = self.model.generate(
-            past_values=from_numpy(hist).to(self.model.dtype).to(self.model.device),
-            past_time_features=from_numpy(
-                hist_x[
-                    :,
-                    -self.model.config.context_length
-                    - max(self.model.config.lags_sequence) :,
-                ]
-            )
-            .to(self.model.dtype)
-            .to(self.model.device),
-            future_time_features=from_numpy(x_)
-            .to(self.model.dtype)
-            .to(self.model.device),
-            past_observed_mask=from_numpy((~np.isnan(hist)).astype(int)).to(
-                self.model.device
-            ),
-        )
 
         pred = pred.sequences.mean(dim=1).detach().cpu().numpy().T
 
@@ -353,41 +357,66 @@ class HFTransformersForecaster(BaseForecaster):
                 },
                 "deterministic": True,
             },
+            {
+                "model_path": "huggingface/informer-tourism-monthly",
+                "fit_strategy": "full",
+                "validation_split": 0.0,
+                "training_args": {
+                    "num_train_epochs": 1,
+                    "output_dir": "test_output",
+                    "per_device_train_batch_size": 32,
+                },
+                "config": {
+                    "lags_sequence": [1, 2, 3],
+                    "context_length": 2,
+                    "prediction_length": 4,
+                },
+                "deterministic": True,
+            },
         ]
 
 
 class PyTorchDataset(Dataset):
     """Dataset for use in sktime deep learning forecasters."""
 
-    def __init__(self, y, seq_len, fh=None, X=None):
-        self.y = y.values
-        self.X = X.values if X is not None else X
+    def __init__(self, y, seq_len, fh, X=None):
+        # convert once to owned, contiguous float32 tensors,
+        # so that samples in __getitem__ are zero-copy views
+        self.y = torch.from_numpy(y.to_numpy(dtype=np.float32, copy=True))
+        self._observed_mask = (~self.y.isnan()).to(int)
+        if X is not None:
+            X = np.ascontiguousarray(X.to_numpy(dtype=np.float32, copy=True))
+            X = torch.from_numpy(X)
+        self.X = X
         self.seq_len = seq_len
         self.fh = fh
+        self._len = max(len(self.y) - seq_len - fh + 1, 0)
+
+        # without exogenous data, the time features are empty placeholders,
+        # allocated once and shared by all samples
+        if X is None:
+            self._hist_exog = torch.empty((seq_len, 0))
+            self._exog_data = torch.empty((fh, 0))
 
     def __len__(self):
         """Return length of dataset."""
-        return max(len(self.y) - self.seq_len - self.fh + 1, 0)
+        return self._len
 
     def __getitem__(self, i):
         """Return data point."""
-        from torch import from_numpy, tensor
+        hist_end = i + self.seq_len
+        pred_end = hist_end + self.fh
 
-        hist_y = tensor(self.y[i : i + self.seq_len]).float()
         if self.X is not None:
-            exog_data = tensor(
-                self.X[i + self.seq_len : i + self.seq_len + self.fh]
-            ).float()
-            hist_exog = tensor(self.X[i : i + self.seq_len]).float()
+            exog_data = self.X[hist_end:pred_end]
+            hist_exog = self.X[i:hist_end]
         else:
-            exog_data = tensor([[]] * self.fh)
-            hist_exog = tensor([[]] * self.seq_len)
+            exog_data = self._exog_data
+            hist_exog = self._hist_exog
         return {
-            "past_values": hist_y,
+            "past_values": self.y[i:hist_end],
             "past_time_features": hist_exog,
             "future_time_features": exog_data,
-            "past_observed_mask": (~hist_y.isnan()).to(int),
-            "future_values": from_numpy(
-                self.y[i + self.seq_len : i + self.seq_len + self.fh]
-            ).float(),
+            "past_observed_mask": self._observed_mask[i:hist_end],
+            "future_values": self.y[hist_end:pred_end],
         }
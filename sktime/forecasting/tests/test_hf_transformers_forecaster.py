@@ -0,0 +1,151 @@
+# copyright: sktime developers, BSD-3-Clause License (see LICENSE file)
+"""Tests for HFTransformersForecaster and its PyTorchDataset."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sktime.forecasting.hf_transformers_forecaster import (
+    HFTransformersForecaster,
+    PyTorchDataset,
+)
+from sktime.tests.test_switch import run_test_for_class, run_test_module_changed
+from sktime.utils.dependencies import _check_soft_dependencies
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(HFTransformersForecaster),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_fit_predict_default_training_args(tmp_path, monkeypatch):
+    """Test fit and predict with training_args left at its None default.
+
+    _fit deep-copies and extends the training arguments, which failed on the raw
+    None default of training_args. Uses a tiny local checkpoint, so no download.
+    """
+    from transformers import InformerConfig, InformerForPrediction
+
+    from sktime.datasets import load_airline
+
+    model_path = tmp_path / "model"
+    model_config = InformerConfig(
+        prediction_length=4,
+        context_length=2,
+        lags_sequence=[1, 2, 3],
+        num_time_features=0,
+        d_model=8,
+        encoder_layers=1,
+        decoder_layers=1,
+        encoder_attention_heads=1,
+        decoder_attention_heads=1,
+        encoder_ffn_dim=8,
+        decoder_ffn_dim=8,
+    )
+    InformerForPrediction(model_config).save_pretrained(model_path)
+
+    # the default TrainingArguments write their output to the working directory
+    monkeypatch.chdir(tmp_path)
+
+    forecaster = HFTransformersForecaster(
+        model_path=str(model_path),
+        fit_strategy="full",
+        config={"lags_sequence": [1, 2, 3], "context_length": 2},
+    )
+    assert forecaster.get_params()["training_args"] is None
+
+    y = load_airline()
+    forecaster.fit(y, fh=[1, 2, 3])
+    y_pred = forecaster.predict()
+
+    assert len(y_pred) == 3
+
+
+@pytest.mark.skipif(
+    not run_test_for_class(HFTransformersForecaster),
+    reason="run test only if softdeps are present and incrementally (if requested)",
+)
+def test_unknown_fit_strategy_raises_before_model_load():
+    """Test that an unknown fit_strategy raises ValueError before loading a model."""
+    from sktime.datasets import load_airline
+
+    forecaster = HFTransformersForecaster(
+        model_path="does/not-exist", fit_strategy="bad"
+    )
+    with pytest.raises(ValueError, match="Unknown fit strategy"):
+        forecaster.fit(load_airline(), fh=[1, 2, 3])
+
+
+@pytest.mark.skipif(
+    not run_test_module_changed("sktime.forecasting.hf_transformers_forecaster")
+    or not _check_soft_dependencies("torch", severity="none"),
+    reason="run test only if torch is present and module has changed",
+)
+@pytest.mark.parametrize("with_X", [False, True])
+def test_pytorch_dataset(with_X):
+    """Test length, keys, shapes, dtypes and values of PyTorchDataset samples."""
+    import torch
+
+    seq_len, fh, n_x = 4, 2, 3
+    y = pd.Series(np.arange(10, dtype=np.float64))
+    y.iloc[2] = np.nan
+    X = pd.DataFrame(np.arange(30, dtype=np.float64).reshape(10, n_x))
+
+    dataset = PyTorchDataset(y, seq_len, fh=fh, X=X if with_X else None)
+
+    assert len(dataset) == 10 - seq_len - fh + 1
+
+    i = 1
+    sample = dataset[i]
+    expected_keys = {
+        "past_values",
+        "past_time_features",
+        "future_time_features",
+        "past_observed_mask",
+        "future_values",
+    }
+    assert set(sample.keys()) == expected_keys
+
+    past_values = sample["past_values"]
+    future_values = sample["future_values"]
+    assert past_values.shape == (seq_len,)
+    assert future_values.shape == (fh,)
+    assert past_values.dtype == torch.float32
+    assert future_values.dtype == torch.float32
+    np.testing.assert_array_equal(past_values.numpy(), y.values[i : i + seq_len])
+    np.testing.assert_array_equal(
+        future_values.numpy(), y.values[i + seq_len : i + seq_len + fh]
+    )
+
+    mask = sample["past_observed_mask"]
+    assert mask.shape == (seq_len,)
+    assert mask.dtype == torch.int64
+    np.testing.assert_array_equal(mask.numpy(), [1, 0, 1, 1])
+
+    past_x = sample["past_time_features"]
+    future_x = sample["future_time_features"]
+    if with_X:
+        assert past_x.shape == (seq_len, n_x)
+        assert future_x.shape == (fh, n_x)
+        assert past_x.dtype == torch.float32
+        assert future_x.dtype == torch.float32
+        np.testing.assert_array_equal(past_x.numpy(), X.values[i : i + seq_len])
+        np.testing.assert_array_equal(
+            future_x.numpy(), X.values[i + seq_len : i + seq_len + fh]
+        )
+    else:
+        assert past_x.shape == (seq_len, 0)
+        assert future_x.shape == (fh, 0)
+        assert past_x.dtype == torch.float32
+        assert future_x.dtype == torch.float32
+
+
+@pytest.mark.skipif(
+    not run_test_module_changed("sktime.forecasting.hf_transformers_forecaster")
+    or not _check_soft_dependencies("torch", severity="none"),
+    reason="run test only if torch is present and module has changed",
+)
+def test_pytorch_dataset_too_short():
+    """Test that PyTorchDataset is empty if the series is shorter than a window."""
+    y = pd.Series(np.arange(5, dtype=np.float64))
+    dataset = PyTorchDataset(y, seq_len=4, fh=2)
+    assert len(dataset) == 0